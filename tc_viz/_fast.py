@@ -0,0 +1,35 @@
+"""
+_fast.py
+--------
+Optional Numba-accelerated kernels with pure-numpy fallbacks.
+Import functions from here rather than importing numba directly, so the
+package keeps working when numba is not installed.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # optional dependency
+    njit = None
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def lon_to_360_arr(lon: np.ndarray) -> np.ndarray:
+        """Convert an array of longitudes from -180/180 to 0-360 degrees."""
+        out = np.empty_like(lon)
+        for i in prange(lon.size):
+            out[i] = (lon[i] % 360.0 + 360.0) % 360.0
+        return out
+
+else:
+
+    def lon_to_360_arr(lon: np.ndarray) -> np.ndarray:
+        """Convert an array of longitudes from -180/180 to 0-360 degrees."""
+        # np.remainder already returns non-negative results for a
+        # positive divisor.
+        return np.remainder(lon, 360.0)
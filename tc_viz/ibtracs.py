@@ -8,7 +8,27 @@ tc_viz has no cross-repo dependency.
 
 from __future__ import annotations
 
+import functools
+import os
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyarrow import csv as pacsv
+
+from ._fast import lon_to_360_arr
+
+try:
+    import polars as pl
+except ImportError:  # optional dependency
+    pl = None
+
+# True once a polars CSV scan has answered a lookup in this process.
+# Polars is only worth using for the very first query against an
+# unconverted CSV; from the second call on, building the Parquet sidecar
+# and memoizing the full table is the faster steady state.
+_polars_scan_used = False
 
 
 # ---------------------------------------------------------------------------
@@ -34,11 +54,116 @@ def _lon_to_360(dlon: float) -> float:
     return (360 + (dlon % 360)) % 360
 
 
+def _ensure_parquet_sidecar(ibtracs_csv: str) -> str:
+    """
+    Convert the IBTrACS CSV to a Snappy-compressed Parquet sidecar, once.
+
+    The sidecar lives next to the CSV as ``<csv>.parquet`` and is
+    rebuilt whenever the CSV is newer than it (e.g. after downloading a
+    fresh IBTrACS revision to the same path). Parquet's
+    columnar layout lets later reads pull only the columns they need and
+    push the NAME filter down to row groups, instead of re-parsing the
+    full ~500 MB CSV on every call.
+    """
+    sidecar = ibtracs_csv + ".parquet"
+    stale = os.path.exists(sidecar) and (
+        os.path.getmtime(ibtracs_csv) > os.path.getmtime(sidecar)
+    )
+    if stale or not os.path.exists(sidecar):
+        table = pacsv.read_csv(
+            ibtracs_csv,
+            read_options=pacsv.ReadOptions(skip_rows_after_names=1),  # units row
+            convert_options=pacsv.ConvertOptions(
+                include_columns=_EXTRACT_VARS,
+                column_types={"ISO_TIME": pa.string()},
+                strings_can_be_null=True,
+                null_values=[" ", ""],
+            ),
+        )
+        pq.write_table(table, sidecar, compression="snappy", row_group_size=50_000)
+    return sidecar
+
+
+@functools.lru_cache(maxsize=2)
+def _load_ibtracs_full(ibtracs_csv: str, mtime: float) -> pd.DataFrame:
+    """
+    Load the full, column-projected IBTrACS table, memoized.
+
+    Keeping the parsed table in memory amortizes the load across a batch
+    of ``get_storm_track`` calls against the same file. ``mtime`` is the
+    CSV's modification time and exists purely to invalidate the cache
+    when the file changes on disk.
+    """
+    sidecar = _ensure_parquet_sidecar(ibtracs_csv)
+    full = pq.read_table(sidecar, columns=_EXTRACT_VARS).to_pandas()
+    # Categorical NAME turns the per-storm equality filter into an
+    # integer-code comparison instead of a full string compare.
+    full["NAME"] = full["NAME"].astype("category")
+    return full
+
+
+def _read_storm_rows_chunked(name: str, ibtracs_csv: str) -> pd.DataFrame:
+    """
+    Stream the CSV in chunks and keep only the named storm's rows.
+
+    Fallback for memory-bounded environments: peak memory is one
+    200k-row chunk rather than the whole file, at the cost of
+    re-parsing the CSV on every call. Irrelevant rows are discarded
+    chunk by chunk, so only the storm's few dozen rows survive. The
+    units row is dropped for free because its NAME cell is blank.
+    """
+    chunks = [
+        chunk[chunk["NAME"] == name]
+        for chunk in pd.read_csv(
+            ibtracs_csv,
+            usecols=_EXTRACT_VARS,
+            chunksize=200_000,
+            dtype=str,
+            na_values=[" ", ""],
+            engine="c",
+        )
+    ]
+    return pd.concat(chunks, ignore_index=True)
+
+
+def _scan_storm_track_polars(
+    name: str,
+    year: int,
+    ibtracs_csv: str,
+    filter_missing_wmo: bool,
+) -> pd.DataFrame:
+    """
+    Lazy Polars CSV scan for a single storm's rows.
+
+    Polars pushes the NAME/year predicates and the column projection
+    into the CSV scan itself and parses in parallel, so no full-file
+    DataFrame is ever materialized. Used when polars is installed and
+    the Parquet sidecar has not been built yet.
+    """
+    lf = (
+        pl.scan_csv(
+            ibtracs_csv,
+            skip_rows_after_header=1,  # units row
+            schema_overrides={"ISO_TIME": pl.Utf8},
+            null_values=[" ", ""],
+            ignore_errors=True,
+        )
+        .filter(pl.col("NAME") == name)
+        .filter(pl.col("ISO_TIME").str.starts_with(str(year)))
+        .select(_EXTRACT_VARS)
+    )
+    if filter_missing_wmo:
+        lf = lf.filter(pl.col("WMO_WIND").is_not_null() & pl.col("WMO_PRES").is_not_null())
+    return lf.collect(engine="streaming").to_pandas()
+
+
 def get_storm_track(
     name: str,
     year: int,
     ibtracs_csv: str,
     filter_missing_wmo: bool = True,
+    low_memory: bool = False,
+    cache_path: str | None = None,
 ) -> pd.DataFrame:
     """
     Load IBTrACS CSV data and return track rows for a named storm in a given year.
@@ -55,6 +180,15 @@ def get_storm_track(
         If ``True`` (default), rows with missing WMO wind or pressure are
         dropped. Set to ``False`` for years like 2021 where WMO fields may
         be blank in early data.
+    low_memory:
+        If ``True``, stream the CSV in chunks instead of building or
+        caching a full in-memory table. Slower per call, but peak memory
+        stays at one chunk — use on small-RAM machines.
+    cache_path:
+        Optional path to a Feather file caching the processed track. If
+        the file exists it is read back directly, skipping the CSV
+        entirely; otherwise the computed track is written there. Useful
+        when iterating on plot styling for the same storm.
 
     Returns
     -------
@@ -62,24 +196,57 @@ def get_storm_track(
         Filtered track data with ``LON_180`` (original longitude) and
         ``LON`` converted to 0-360 degrees.
     """
-    data = pd.read_csv(ibtracs_csv, low_memory=False)
-    data = data.iloc[1:, :]  # drop units row
-
-    year_start = pd.to_datetime(str(year))
-    year_end = pd.to_datetime(str(year + 1))
+    if cache_path is not None and os.path.exists(cache_path):
+        return pd.read_feather(cache_path)
+
+    global _polars_scan_used
+    if (
+        pl is not None
+        and not low_memory
+        and not _polars_scan_used
+        and not os.path.exists(ibtracs_csv + ".parquet")
+    ):
+        # First lookup only: polars answers the query directly from the
+        # CSV with pushdown, skipping the one-time sidecar conversion.
+        # Subsequent calls fall through and build the sidecar so the
+        # memoized full-table path takes over.
+        _polars_scan_used = True
+        data = _scan_storm_track_polars(name, year, ibtracs_csv, filter_missing_wmo)
+    else:
+        if low_memory:
+            data = _read_storm_rows_chunked(name, ibtracs_csv)
+        else:
+            full = _load_ibtracs_full(ibtracs_csv, os.path.getmtime(ibtracs_csv))
+            data = full[full["NAME"] == name]
+
+        # Cheap string-prefix year filter first, so to_datetime only
+        # parses the handful of rows belonging to this storm's year.
+        data = data[data["ISO_TIME"].str.slice(0, 4) == str(year)].copy()
+
+        if filter_missing_wmo:
+            # One combined mask and one slice instead of two sequential
+            # frame copies.
+            data = data.loc[data["WMO_WIND"].notna() & data["WMO_PRES"].notna()]
+
+    # NAME dtype must not depend on which branch answered the call: the
+    # polars and chunked paths yield plain strings, the memoized table
+    # categorical. Normalize so callers can concatenate or compare tracks.
+    data["NAME"] = data["NAME"].astype("category")
 
-    data = data[data["NAME"] == name]
     data["ISO_TIME"] = pd.to_datetime(data["ISO_TIME"])
 
-    mask = (data["ISO_TIME"] >= year_start) & (data["ISO_TIME"] < year_end)
-    data = data[mask]
-    data = data[_EXTRACT_VARS]
-
-    if filter_missing_wmo:
-        data = data[data["WMO_WIND"] != " "]
-        data = data[data["WMO_PRES"] != " "]
+    # Coerce every numeric column once here, so the plotting code never
+    # repeats Series-wide casts or per-row conversions.
+    num_cols = ["LAT", "LON", "WMO_WIND", "WMO_PRES"] + [c for c in _EXTRACT_VARS if "_R" in c]
+    data[num_cols] = data[num_cols].apply(pd.to_numeric, errors="coerce").astype("float32")
 
     data["LON_180"] = data["LON"]
-    data["LON"] = data["LON"].astype(float).apply(_lon_to_360)
+    # Back to float32 to keep the one-pass coercion's dtype uniform
+    data["LON"] = lon_to_360_arr(data["LON"].to_numpy(dtype=np.float64)).astype(np.float32)
+
+    if cache_path is not None:
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        data = data.reset_index(drop=True)
+        data.to_feather(cache_path)
 
     return data
\ No newline at end of file
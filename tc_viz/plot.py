@@ -6,12 +6,17 @@ Functions for drawing TC track maps with wind radii arcs.
 
 from __future__ import annotations
 
+import matplotlib
 import matplotlib.patches as patches
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.transforms import offset_copy
 import matplotlib.ticker as mticker
+from matplotlib.path import Path
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
 from cartopy.mpl.gridliner import LONGITUDE_FORMATTER, LATITUDE_FORMATTER
+import numpy as np
 import pandas as pd
 
 from .config import (
@@ -33,22 +38,72 @@ from .config import (
 )
 
 
+# Speed up Agg rendering of long polylines (coastlines, arcs)
+matplotlib.rcParams["path.simplify"] = True
+matplotlib.rcParams["path.simplify_threshold"] = 1.0
+matplotlib.rcParams["agg.path.chunksize"] = 10_000
+
+
+# ---------------------------------------------------------------------------
+# Map features
+# ---------------------------------------------------------------------------
+
+# Module-level Natural Earth features: the shapefiles are read and cached
+# once per process and reused across figures. Cartopy clips them to the
+# plot extent at draw time, which stays correct for the 0-360 longitudes
+# this repo plots in.
+_COAST = cfeature.NaturalEarthFeature(
+    "physical", "coastline", "50m", edgecolor="black", facecolor="none"
+)
+_BORDERS = cfeature.NaturalEarthFeature(
+    "cultural", "admin_0_boundary_lines_land", "50m", edgecolor="black", facecolor="none"
+)
+
+
 # ---------------------------------------------------------------------------
 # Wind radii drawing helpers
 # ---------------------------------------------------------------------------
 
+# Unit-circle lookup table shared by all wind radii rings (1-degree steps).
+# Pre-sampling the quadrants avoids matplotlib's adaptive Bezier
+# subdivision of an Arc patch at render time.
+_THETA = np.linspace(0.0, 2.0 * np.pi, 361)
+_COS = np.cos(_THETA)
+_SIN = np.sin(_THETA)
+
+
+def _ring_path(xcenter: float, ycenter: float, radii: list[float]) -> Path:
+    """
+    Build one Path for a full wind radius ring from the quadrant LUT.
+
+    Each quadrant is a 91-point polyline scaled by its own radius and
+    started with a MOVETO, so the four quadrants render as one fused
+    patch instead of four separately sampled Arcs.
+    """
+    verts = np.empty((4 * 91, 2))
+    codes = np.full(4 * 91, Path.LINETO, dtype=Path.code_type)
+    for k, rad in enumerate(radii):
+        j0 = 90 * k
+        s = slice(91 * k, 91 * (k + 1))
+        verts[s, 0] = _COS[j0:j0 + 91] * rad + xcenter
+        verts[s, 1] = _SIN[j0:j0 + 91] * rad + ycenter
+        codes[91 * k] = Path.MOVETO
+    return Path(verts, codes)
+
 def draw_wind_radii_arcs(
     xcenter: float,
     ycenter: float,
     radii: list[float],
-    ax,
     lw: float = ARC_LINEWIDTH,
     ec: str = COLOR_R34,
-) -> None:
+) -> tuple[list[patches.PathPatch], list[list[tuple[float, float]]]]:
     """
-    Draw four quadrant arcs representing a wind radius ring.
+    Build the artists for one wind radius ring without drawing them.
 
     Quadrant order: SE, NE, SW, NW (matching IBTrACS column order).
+    Returning the pieces lets :func:`plot_track` batch the rings of many
+    track points into one PatchCollection and one LineCollection per
+    color, instead of adding each arc and spoke to the axes separately.
 
     Parameters
     ----------
@@ -56,57 +111,76 @@ def draw_wind_radii_arcs(
         Centre point of the arcs in projected coordinates.
     radii:
         List of four radii ``[SE, NE, SW, NW]`` in plot units.
-    ax:
-        Matplotlib axes to draw on.
     lw:
         Line width.
     ec:
         Edge/line color.
+
+    Returns
+    -------
+    tuple[list, list]
+        A single fused PathPatch covering all four quadrant arcs, and
+        the four spoke line segments (each a pair of ``(x, y)``
+        endpoints).
     """
-    for rad, theta in zip(radii, [0, 90, 180, 270]):
-        arc = patches.Arc(
-            (xcenter, ycenter), 2 * rad, 2 * rad,
-            theta1=theta, theta2=theta + 90,
+    arcs = [
+        patches.PathPatch(
+            _ring_path(xcenter, ycenter, radii),
             lw=lw, ec=ec, fc="none",
         )
-        ax.add_patch(arc)
-
-    # Horizontal spokes
-    ax.hlines(
-        [ycenter, ycenter],
-        [xcenter + radii[0], xcenter - radii[1]],
-        [xcenter + radii[3], xcenter - radii[2]],
-        lw=lw, colors=ec,
-    )
-    # Vertical spokes
-    ax.vlines(
-        [xcenter, xcenter],
-        [ycenter + radii[0], ycenter - radii[2]],
-        [ycenter + radii[1], ycenter - radii[3]],
-        lw=lw, colors=ec,
-    )
-
-
-def _parse_radii(row: pd.Series, prefix: str, scale: float = RADIUS_SCALE) -> list[float] | None:
+    ]
+
+    segments = [
+        # Horizontal spokes
+        [(xcenter + radii[0], ycenter), (xcenter + radii[3], ycenter)],
+        [(xcenter - radii[1], ycenter), (xcenter - radii[2], ycenter)],
+        # Vertical spokes
+        [(xcenter, ycenter + radii[0]), (xcenter, ycenter + radii[1])],
+        [(xcenter, ycenter - radii[2]), (xcenter, ycenter - radii[3])],
+    ]
+    return arcs, segments
+
+
+def _parse_radii(
+    track: pd.DataFrame, prefix: str, scale: float = RADIUS_SCALE
+) -> tuple[np.ndarray, np.ndarray]:
     """
-    Extract and scale the four quadrant radii for a given wind threshold.
-
-    Returns ``None`` if any quadrant value is missing.
+    Extract and scale the four quadrant radii for a given wind threshold,
+    vectorized over the whole track.
 
     Parameters
     ----------
-    row:
-        A single row from the IBTrACS track DataFrame.
+    track:
+        IBTrACS track DataFrame.
     prefix:
         Column prefix, e.g. ``"USA_R34"`` or ``"USA_R50"``.
     scale:
         Divisor to convert nautical miles to plot units.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        An ``(N, 4)`` float array of radii in quadrant order SE, NE, SW,
+        NW, and a length-``N`` boolean mask that is ``True`` where all
+        four quadrant values are present.
+    """
+    cols = [f"{prefix}_{q}" for q in ["SE", "NE", "SW", "NW"]]
+    # Columns are already float (coerced once in get_storm_track)
+    arr = track[cols].to_numpy(dtype=np.float64)
+    arr /= scale
+    valid = ~np.isnan(arr).any(axis=1)
+    return arr, valid
+
+
+def _fmt_wmo(value: float) -> str:
+    """
+    Format a WMO wind/pressure value for an annotation label.
+
+    The track stores these as floats, but labels should read "30 KTS",
+    not "30.0 KTS", and missing values should render blank (as the
+    original string data did), not "nan".
     """
-    quads = [f"{prefix}_{q}" for q in ["SE", "NE", "SW", "NW"]]
-    values = [row[q] for q in quads]
-    if any(v == " " or pd.isna(v) for v in values):
-        return None
-    return [int(v) / scale for v in values]
+    return "" if np.isnan(value) else f"{value:.0f}"
 
 
 # ---------------------------------------------------------------------------
@@ -122,8 +196,8 @@ def _setup_map(
     offset: float = MAP_OFFSET,
 ) -> None:
     """Configure the cartopy axes with coastlines, borders, and gridlines."""
-    ax.add_feature(cfeature.BORDERS)
-    ax.add_feature(cfeature.COASTLINE)
+    ax.add_feature(_BORDERS)
+    ax.add_feature(_COAST)
     ax.set_extent(
         [min_lon - offset, max_lon + offset, min_lat - offset, max_lat + offset],
         crs=ccrs.PlateCarree(),
@@ -191,58 +265,112 @@ def plot_track(
     ax = fig.add_subplot(1, 1, 1, projection=crs_latlon)
 
     # Map bounds from track extent
-    lats = track["LAT"].astype(float)
-    lons = track["LON"].astype(float)
+    # Hoist the needed columns into plain arrays once; indexing these by
+    # position avoids building a new Series per row via track.iloc[i].
+    lats = track["LAT"].to_numpy(dtype=float)
+    lons = track["LON"].to_numpy(dtype=float)
+    times_str = pd.to_datetime(track["ISO_TIME"]).dt.strftime("%d/%HZ").to_numpy()
+    winds = track["WMO_WIND"].to_numpy()
+    press = track["WMO_PRES"].to_numpy()
+
     _setup_map(ax, lats.min(), lats.max(), lons.min(), lons.max(), offset=map_offset)
 
+    # Radii for all thresholds, precomputed over the whole track
+    thresholds = [("USA_R34", color_r34), ("USA_R50", color_r50), ("USA_R64", color_r64)]
+    radii_by_prefix = {}
+    valid_by_prefix = {}
+    for prefix, _ in thresholds:
+        arr, valid = _parse_radii(track, prefix, scale=radius_scale)
+        # All-zero rings (common below the 34 kt threshold) would draw
+        # nothing visible; skip them outright.
+        valid &= (arr != 0).any(axis=1)
+        radii_by_prefix[prefix], valid_by_prefix[prefix] = arr, valid
+
+    # One batched PROJ transform for all points. Even for matching CRSs
+    # this is not the identity: it wraps the track's 0-360 longitudes
+    # into the projection's -180..180 data space.
+    xy = ax.projection.transform_points(crs_latlon, lons, lats)
+    xs, ys = xy[:, 0], xy[:, 1]
+
     sign = 1
 
-    for i in range(len(track)):
-        row = track.iloc[i]
-        lon = float(row["LON"])
-        lat = float(row["LAT"])
-        at_x, at_y = ax.projection.transform_point(lon, lat, src_crs=crs_latlon)
-
-        # Draw wind radii arcs for each threshold
-        for prefix, color in [
-            ("USA_R34", color_r34),
-            ("USA_R50", color_r50),
-            ("USA_R64", color_r64),
-        ]:
-            radii = _parse_radii(row, prefix, scale=radius_scale)
-            if radii is not None:
-                draw_wind_radii_arcs(at_x, at_y, radii, ax=ax, ec=color)
-
-        # Track marker
-        ax.plot(
-            lon, lat,
-            marker="o",
-            markersize=MARKER_SIZE,
-            markeredgewidth=MARKER_EDGE_WIDTH,
-            markerfacecolor=MARKER_FACE_COLOR,
-            markeredgecolor=MARKER_EDGE_COLOR,
-            transform=crs_latlon,
+    # All track markers in one PathCollection rather than N Line2D artists
+    ax.scatter(
+        lons, lats,
+        s=MARKER_SIZE ** 2,
+        facecolor=MARKER_FACE_COLOR,
+        edgecolor=MARKER_EDGE_COLOR,
+        linewidths=MARKER_EDGE_WIDTH,
+        transform=crs_latlon,
+        zorder=3,
+    )
+
+    arcs_by_prefix = {prefix: [] for prefix, _ in thresholds}
+    segments_by_prefix = {prefix: [] for prefix, _ in thresholds}
+
+    # Annotation offsets resolved once: a point-offset transform for the
+    # labels, and the same offset in data units so the leader lines can
+    # batch into a single LineCollection instead of one FancyArrowPatch
+    # per annotation.
+    text_transforms = {}
+    offsets_data = {}
+    inv = ax.transData.inverted()
+    origin_disp = np.asarray(ax.transData.transform((0.0, 0.0)))
+    dpi_scale = fig.dpi / 72.0
+    for key, (x_pts, y_pts) in ((1, ANNOTATION_OFFSET_POS), (-1, ANNOTATION_OFFSET_NEG)):
+        text_transforms[key] = offset_copy(
+            ax.transData, fig=fig, x=x_pts, y=y_pts, units="points"
         )
+        shifted = inv.transform(origin_disp + np.array([x_pts, y_pts]) * dpi_scale)
+        offsets_data[key] = shifted - inv.transform(origin_disp)
+    arrow_segments = []
+
+    for i in range(len(track)):
+        at_x, at_y = xs[i], ys[i]
+
+        # Collect wind radii artists for each threshold
+        for prefix, color in thresholds:
+            if valid_by_prefix[prefix][i]:
+                arcs, segments = draw_wind_radii_arcs(
+                    at_x, at_y, radii_by_prefix[prefix][i], ec=color
+                )
+                arcs_by_prefix[prefix].extend(arcs)
+                segments_by_prefix[prefix].extend(segments)
 
         # Annotation: date/time, wind, pressure
-        time_str = row["ISO_TIME"].strftime("%d/%H") + "Z"
-        info_str = f"{time_str}, {row['WMO_WIND']} KTS, {row['WMO_PRES']} hPa"
-
-        x_off, y_off = ANNOTATION_OFFSET_POS if sign > 0 else ANNOTATION_OFFSET_NEG
-        ax.annotate(
-            info_str,
-            xy=(at_x, at_y),
-            xytext=(x_off, y_off),
-            textcoords="offset points",
+        info_str = f"{times_str[i]}, {_fmt_wmo(winds[i])} KTS, {_fmt_wmo(press[i])} hPa"
+        ax.text(
+            at_x, at_y, info_str,
+            transform=text_transforms[sign],
             color="black",
             backgroundcolor="white",
             size="large",
-            arrowprops=dict(arrowstyle="-", color="black", linewidth=1.0),
         )
+        dx, dy = offsets_data[sign]
+        arrow_segments.append([(at_x, at_y), (at_x + dx, at_y + dy)])
         sign *= -1
 
+    if arrow_segments:
+        ax.add_collection(LineCollection(arrow_segments, colors="black", linewidths=1.0))
+
+    # One collection per threshold color: a single draw pass instead of
+    # one add_patch / hlines / vlines call per ring
+    for prefix, color in thresholds:
+        if arcs_by_prefix[prefix]:
+            ax.add_collection(PatchCollection(arcs_by_prefix[prefix], match_original=True))
+            ax.add_collection(
+                LineCollection(
+                    segments_by_prefix[prefix], linewidths=ARC_LINEWIDTH, colors=color
+                )
+            )
+
     if output_path:
-        plt.savefig(output_path, bbox_inches="tight")
+        # bbox_inches="tight" would trigger a second full render just to
+        # measure the bbox; render once and reuse the measured bbox,
+        # padded by the same margin bbox_inches="tight" applies.
+        fig.canvas.draw()
+        bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(0.1)
+        fig.savefig(output_path, bbox_inches=bbox)
         print(f"Plot saved to: {output_path}")
     else:
         plt.show()